@@ -1,35 +1,11 @@
 import asyncio
-from agents import Agent, Runner, AsyncOpenAI, OpenAIChatCompletionsModel
-from agents.run import RunConfig
-from dotenv import load_dotenv
-import os
+from agents import Agent, Runner
+import uvloop
+from aiagents._runtime import eager_task_factory, get_run_config
 from agents import enable_verbose_stdout_logging
 enable_verbose_stdout_logging()
 
-# Load the environment variables from the .env file
-load_dotenv()
-
-# Set up the your Gemini API key
-gemini_api_key = os.getenv('GEMINI_API_KEY')
-
-# 1 Set up the provider to use the Gemini API Key
-provider = AsyncOpenAI(
-    api_key=gemini_api_key,
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
-)
-
-# 2 Set up the model to use the provider
-model = OpenAIChatCompletionsModel(
-    model='gemini-2.0-flash',
-    openai_client=provider,
-)
-
-# 3 Set up the run configuraion
-run_config = RunConfig(
-    model=model,
-    model_provider=provider,
-    tracing_disabled=True,
-)
+# 1-3 Provider, model & run config are shared (see aiagents/_runtime.py)
 
 # 4 Set up the agent to use the model
 agent = Agent(
@@ -38,13 +14,17 @@ agent = Agent(
 )
 
 async def main():
+    # Run new tasks eagerly until their first real suspension point
+    asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
     # 5 Set up the runner to use the agent
     result = await Runner.run(
         agent,
         input="what is the meaning of life?",
-        run_config=run_config,
+        run_config=get_run_config(),
     )
     print(result.final_output)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(main())
\ No newline at end of file
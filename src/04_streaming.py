@@ -1,35 +1,12 @@
 import asyncio
-from agents import Agent, Runner, AsyncOpenAI, OpenAIChatCompletionsModel
-from agents.run import RunConfig
-from dotenv import load_dotenv
-import os
+from agents import Agent, Runner
+import sys
+import uvloop
+from aiagents._runtime import eager_task_factory, get_run_config
 from agents import enable_verbose_stdout_logging
 # enable_verbose_stdout_logging()
 
-# Load the environment variables from the .env file
-load_dotenv()
-
-# Set up the your Gemini API key
-gemini_api_key = os.getenv('GEMINI_API_KEY')
-
-# 1 Set up the provider to use the Gemini API Key
-provider = AsyncOpenAI(
-    api_key=gemini_api_key,
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
-)
-
-# 2 Set up the model to use the provider
-model = OpenAIChatCompletionsModel(
-    model='gemini-2.0-flash',
-    openai_client=provider,
-)
-
-# 3 Set up the run configuraion
-run_config = RunConfig(
-    model=model,
-    model_provider=provider,
-    tracing_disabled=True,
-)
+# 1-3 Provider, model & run config are shared (see aiagents/_runtime.py)
 
 # 4 Set up the agent to use the model
 agent = Agent(
@@ -37,21 +14,58 @@ agent = Agent(
     instructions="You are a helpful assistant."
 )
 
+# Tokens the stream may run ahead of the printer before it has to wait
+QUEUE_SIZE = 64
+_DONE = None  # sentinel: the stream has ended
+
+
+async def produce_tokens(result, q: asyncio.Queue) -> None:
+    # Only pulls events off the agent stream; never touches stdout
+    try:
+        async for event in result.stream_events():
+            if event.type == "raw_response_event" and hasattr(event.data, 'delta'):
+                await q.put(event.data.delta)
+    finally:
+        await q.put(_DONE)  # always wake the printer, even on errors
+
+
+async def print_tokens(q: asyncio.Queue) -> None:
+    # Wait for one token, then drain whatever else is queued and write it all
+    # with one write + flush, so stdout I/O is batched while the stream runs
+    while True:
+        buf = [await q.get()]
+        while not q.empty():
+            buf.append(q.get_nowait())
+        done = buf[-1] is _DONE
+        if done:
+            buf.pop()
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+        if done:
+            break
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
 # Another Method of Runner is run_streaming
 
 async def main():
+    # Run new tasks eagerly until their first real suspension point
+    asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
     # 5 Set up the runner to use the agent
     result = Runner.run_streamed(
         agent,
         input="Hi",
-        run_config=run_config,
+        run_config=get_run_config(),
     )
 
-    async for event in result.stream_events():
-        if event.type == "raw_response_event" and hasattr(event.data, 'delta'):
-            token = event.data.delta
-            print(token)
+    # Stream consumer and stdout printer run as separate tasks joined by a queue
+    q: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    producer = asyncio.create_task(produce_tokens(result, q))
+    await print_tokens(q)
+    await producer  # re-raise any error from the stream
     # print(result.final_output)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(main())
\ No newline at end of file
@@ -0,0 +1,45 @@
+import asyncio
+from functools import lru_cache
+from agents import AsyncOpenAI, OpenAIChatCompletionsModel
+from agents.run import RunConfig
+from dotenv import load_dotenv
+import os
+
+# Shared Gemini provider/model/run config. Each is built lazily on first use
+# and then memoized, so every script (and every agent in one process) shares
+# a single AsyncOpenAI client and its HTTP connection pool.
+
+# Load the environment variables from the .env file
+load_dotenv()
+
+# 1 Set up the provider to use the Gemini API Key
+@lru_cache(maxsize=1)
+def get_provider() -> AsyncOpenAI:
+    return AsyncOpenAI(
+        api_key=os.getenv("GEMINI_API_KEY"),
+        base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+    )
+
+# 2 Set up the model to use the provider
+@lru_cache(maxsize=1)
+def get_model() -> OpenAIChatCompletionsModel:
+    return OpenAIChatCompletionsModel(
+        model="gemini-2.0-flash",
+        openai_client=get_provider(),
+    )
+
+# 3 Set up the run configuraion
+@lru_cache(maxsize=1)
+def get_run_config() -> RunConfig:
+    return RunConfig(
+        model=get_model(),
+        model_provider=get_provider(),
+        tracing_disabled=True,
+    )
+
+# Eager task factory for main(): runs new tasks until their first real suspension.
+# uvloop passes eager_start= to the factory, which Python 3.13's
+# asyncio.eager_task_factory rejects, so drop it (these tasks are always eager)
+def eager_task_factory(loop, coro, **kwargs):
+    kwargs.pop("eager_start", None)
+    return asyncio.eager_task_factory(loop, coro, **kwargs)
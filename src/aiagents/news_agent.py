@@ -1,56 +1,73 @@
 import asyncio
-from agents import Agent, Runner, AsyncOpenAI, OpenAIChatCompletionsModel, function_tool
-from agents.run import RunConfig
+from agents import Agent, Runner, function_tool
 from dotenv import load_dotenv
 import os
+import sys
 import httpx
-from pydantic import BaseModel
-from datetime import datetime, timedelta
+import orjson
+import uvloop
+from pydantic import BaseModel, TypeAdapter
+import time
+from datetime import date, datetime, timedelta, timezone
+from aiagents._runtime import eager_task_factory, get_run_config
 
 load_dotenv()
-gemini_api_key = os.getenv("GEMINI_API_KEY")
 news_api_key = os.getenv("NEWS_API_KEY")
 
-provider = AsyncOpenAI(
-    api_key=gemini_api_key,
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
-)
+NEWS_URL = "https://newsapi.org/v2/everything"
+# Query params that are the same on every request
+_STATIC_PARAMS = {"sortBy": "popularity", "apiKey": news_api_key}
 
-model = OpenAIChatCompletionsModel(
-    model="gemini-2.0-flash",
-    openai_client=provider,
-)
+# Shared HTTP client, so tool calls reuse pooled (HTTP/2) connections
+_CLIENT: httpx.AsyncClient | None = None
 
-run_config = RunConfig(
-    model=model,
-    model_provider=provider,
-    tracing_disabled=True,
-)
+async def _client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _CLIENT
+
+async def _close_client() -> None:
+    # Reset first, so a later _client() call builds a fresh (open) client
+    global _CLIENT
+    client, _CLIENT = _CLIENT, None
+    if client is not None:
+        await client.aclose()
+
+# (computed_at, today, today as str); the date only changes at midnight UTC
+_DATE_CACHE: tuple[float, date, str] = (float("-inf"), date.min, "")
+_DATE_TTL = 60.0
+
+def _date_range(days: int) -> tuple[str, str]:
+    global _DATE_CACHE
+    now = time.monotonic()
+    if now - _DATE_CACHE[0] > _DATE_TTL:
+        today = datetime.now(timezone.utc).date()
+        _DATE_CACHE = (now, today, str(today))
+    _, today, today_str = _DATE_CACHE
+    return str(today - timedelta(days=days)), today_str
 
 async def fetch_news(q: str, days: int = 3):
-    today = datetime.utcnow().date()
-    start_date = today - timedelta(days=days)
-    url = (
-        f"https://newsapi.org/v2/everything?q={q}"
-        f"&from={start_date}"
-        f"&to={today}"
-        f"&sortBy=popularity"
-        f"&apiKey={news_api_key}"
-    )
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        data = response.json()
-        articles = [
-            {
-                "title": a["title"],
-                "description": a.get("description"),
-                "url": a["url"],
-                "content": a.get("content"),
-                "publishedAt": a.get("publishedAt"),
-            }
-            for a in data.get("articles", [])[:3]
-        ]
-        return {"status": data.get("status"), "totalResults": data.get("totalResults"), "articles": articles}
+    start_date, today = _date_range(days)
+    params = {**_STATIC_PARAMS, "q": q, "from": start_date, "to": today}
+    client = await _client()
+    response = await client.get(NEWS_URL, params=params)
+    data = orjson.loads(response.content)
+    articles = [
+        {
+            "title": a["title"],
+            "description": a.get("description"),
+            "url": a["url"],
+            "content": a.get("content"),
+            "publishedAt": a.get("publishedAt"),
+        }
+        for a in data.get("articles", [])[:3]
+    ]
+    return {"status": data.get("status"), "totalResults": data.get("totalResults"), "articles": articles}
 
 @function_tool
 async def get_news(q: str, days: int = 3):
@@ -68,6 +85,9 @@ class Output(BaseModel):
     totalResults: int
     articles: list[Article]
 
+# Serialises the final output straight to JSON bytes (no str round trip)
+_OUTPUT_ADAPTER = TypeAdapter(Output)
+
 agent = Agent(
     name="NewsAgent",
     instructions="You are a News Assistant. Always use the get_news tool to fetch news.",
@@ -76,12 +96,20 @@ agent = Agent(
 )
 
 async def main():
-    result = await Runner.run(
-        agent,
-        input="OpenAI",
-        run_config=run_config,
-    )
-    print(result.final_output.model_dump_json(indent=2))
+    # Run new tasks eagerly until their first real suspension point
+    asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    try:
+        result = await Runner.run(
+            agent,
+            input="OpenAI",
+            run_config=get_run_config(),
+        )
+        sys.stdout.flush()  # keep ordering with any text already printed
+        sys.stdout.buffer.write(_OUTPUT_ADAPTER.dump_json(result.final_output, indent=2) + b"\n")
+        sys.stdout.buffer.flush()
+    finally:
+        await _close_client()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(main())
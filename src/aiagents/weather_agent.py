@@ -1,53 +1,58 @@
 import asyncio
-from agents import Agent, Runner, AsyncOpenAI, OpenAIChatCompletionsModel, function_tool
-from agents.run import RunConfig
+from agents import Agent, Runner, function_tool
 from dotenv import load_dotenv
 import os
+import sys
 from agents import enable_verbose_stdout_logging
 import httpx
-from pydantic import BaseModel
+import orjson
+import uvloop
+from pydantic import BaseModel, TypeAdapter
+from aiagents._runtime import eager_task_factory, get_run_config
 
 # enable_verbose_stdout_logging()
 
 # Load the environment variables from the .env file
 load_dotenv()
 
-# Set up the your Gemini API key
-gemini_api_key = os.getenv("GEMINI_API_KEY")
+# Set up the your Weather API key
 weather_api_key = os.getenv("WEATHER_API_KEY")
 
-# 1 Set up the provider to use the Gemini API Key
-provider = AsyncOpenAI(
-    api_key=gemini_api_key,
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
-)
+# 1-3 Provider, model & run config are shared (see _runtime.py)
 
-# 2 Set up the model to use the provider
-model = OpenAIChatCompletionsModel(
-    model='gemini-2.0-flash',
-    openai_client=provider,
-)
+WEATHER_URL = "http://api.weatherapi.com/v1/current.json"
+# Query params that are the same on every request
+_STATIC_PARAMS = {"key": weather_api_key, "aqi": "no"}
 
-# 3 Set up the run configuraion
-run_config = RunConfig(
-    model=model,
-    model_provider=provider,
-    tracing_disabled=True,
-)
+# Shared HTTP client, so tool calls reuse pooled (HTTP/2) connections
+_CLIENT: httpx.AsyncClient | None = None
 
+async def _client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _CLIENT
+
+async def _close_client() -> None:
+    # Reset first, so a later _client() call builds a fresh (open) client
+    global _CLIENT
+    client, _CLIENT = _CLIENT, None
+    if client is not None:
+        await client.aclose()
 
 async def fetch_weather(query: str):
-    url = (
-        f"http://api.weatherapi.com/v1/current.json?key={weather_api_key}&q={query}&aqi=no"
-    )
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        data = response.json()
-        return {
-            "location": data["location"]["name"],
-            "temperature": data["current"]["temp_c"],
-            "weather": data["current"]["condition"]["text"]
-        }
+    client = await _client()
+    response = await client.get(WEATHER_URL, params={**_STATIC_PARAMS, "q": query})
+    data = orjson.loads(response.content)
+    return {
+        "location": data["location"]["name"],
+        "temperature": data["current"]["temp_c"],
+        "weather": data["current"]["condition"]["text"]
+    }
 
 @function_tool
 async def get_weather(query: str):
@@ -58,6 +63,9 @@ class Weather(BaseModel):
     temperature: float
     weather: str
 
+# Serialises the final output straight to JSON bytes (no str round trip)
+_OUTPUT_ADAPTER = TypeAdapter(Weather)
+
 
 agent = Agent(
     name="agent",
@@ -67,13 +75,22 @@ agent = Agent(
 )
 
 async def main():
-    # 5 Set up the runner to use the agent
-    result = await Runner.run(
-        agent,
-        input="what is the weather in london",
-        run_config=run_config,
-    )
-    print(result.final_output.model_dump_json(indent=2))
+    # Run new tasks eagerly until their first real suspension point
+    asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+    try:
+        # 5 Set up the runner to use the agent
+        result = await Runner.run(
+            agent,
+            input="what is the weather in london",
+            run_config=get_run_config(),
+        )
+        sys.stdout.flush()  # keep ordering with any text already printed
+        sys.stdout.buffer.write(_OUTPUT_ADAPTER.dump_json(result.final_output, indent=2) + b"\n")
+        sys.stdout.buffer.flush()
+    finally:
+        await _close_client()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(main())
\ No newline at end of file